@@ -133,6 +133,10 @@ class Context:
         self.ExistingPrinterId:str = None
 
 
+        # The highest generation that has been validated so far, so Validate doesn't re-check the earlier generations.
+        self._ValidatedGeneration:int = 0
+
+
     # Returns true if the OS is Creality OS, aka K1 or Sonic Pad
     def IsCrealityOs(self) -> bool:
         return self.OsType == OsTypes.SonicPad or self.OsType == OsTypes.K1
@@ -167,7 +171,22 @@ class Context:
             raise e
 
 
+    # Validates all of the generations up to and including the given generation.
+    # Generations that have already been validated are skipped, since the values of a generation aren't changed once it's been validated.
     def Validate(self, generation = 1) -> None:
+        for g in range(self._ValidatedGeneration + 1, generation + 1):
+            if g == 1:
+                self._ValidateGeneration1()
+            elif g == 2:
+                self._ValidateGeneration2()
+            elif g == 3:
+                self._ValidateGeneration3()
+            elif g == 4:
+                self._ValidateGeneration4()
+        self._ValidatedGeneration = max(self._ValidatedGeneration, generation)
+
+
+    def _ValidateGeneration1(self) -> None:
         self._ValidatePathAndExists(self.RepoRootFolder, "Required Env Var OE_REPO_DIR was not found; make sure to run the install.sh script to begin the installation process")
         self._ValidatePathAndExists(self.VirtualEnvPath, "Required Env Var OE_ENV was not found; make sure to run the install.sh script to begin the installation process")
         self._ValidatePathAndExists(self.UserHomePath, "Required Env Var USER_HOME was not found; make sure to run the install.sh script to begin the installation process")
@@ -183,32 +202,35 @@ class Context:
         self.UserHomePath = self.UserHomePath.strip()
         self.CmdLineArgs = self.CmdLineArgs.strip()
 
-        if generation >= 2:
-            if self.IsCompanionOrBambu():
-                self._ValidatePathAndExists(self.CompanionDataRoot, "Required config var Companion Data Path was not found")
-                self._ValidateString(self.CompanionInstanceId, "Required config var Companion Instance Id was not found")
-                self.CompanionDataRoot = self.CompanionDataRoot.strip()
-                self.CompanionInstanceId = self.CompanionInstanceId.strip()
-                if self.OsType != OsTypes.Debian:
-                    raise Exception("The OctoEverywhere companion can only be installed on Debian based operating systems.")
-            else:
-                self._ValidatePathAndExists(self.MoonrakerConfigFilePath, "Required config var Moonraker Config File Path was not found")
-                self._ValidateString(self.MoonrakerServiceFileName, "Required config var Moonraker Service File Name was not found")
-                self.MoonrakerConfigFilePath = self.MoonrakerConfigFilePath.strip()
-                self.MoonrakerServiceFileName = self.MoonrakerServiceFileName.strip()
-
-        if generation >= 3:
-            self._ValidatePathAndExists(self.RootFolder, "Required config var Root Folder was not found")
-            self._ValidatePathAndExists(self.ConfigFolder, "Required config var Config Folder was not found")
-            self._ValidatePathAndExists(self.LogsFolder, "Required config var Logs Folder was not found")
-            self._ValidatePathAndExists(self.LocalFileStorageFolder, "Required config var local storage folder was not found")
-            # This path wont exist on the first install, because it won't be created until the end of the install.
-            self._ValidateString(self.ServiceFilePath, "Required config var service file path was not found")
-            self._ValidateString(self.ServiceName, "Required config var service name was not found")
-
-        if generation >= 4:
-            # The printer ID can be None, this means it didn't exist before we installed the service.
-            pass
+
+    def _ValidateGeneration2(self) -> None:
+        if self.IsCompanionOrBambu():
+            self._ValidatePathAndExists(self.CompanionDataRoot, "Required config var Companion Data Path was not found")
+            self._ValidateString(self.CompanionInstanceId, "Required config var Companion Instance Id was not found")
+            self.CompanionDataRoot = self.CompanionDataRoot.strip()
+            self.CompanionInstanceId = self.CompanionInstanceId.strip()
+            if self.OsType != OsTypes.Debian:
+                raise Exception("The OctoEverywhere companion can only be installed on Debian based operating systems.")
+        else:
+            self._ValidatePathAndExists(self.MoonrakerConfigFilePath, "Required config var Moonraker Config File Path was not found")
+            self._ValidateString(self.MoonrakerServiceFileName, "Required config var Moonraker Service File Name was not found")
+            self.MoonrakerConfigFilePath = self.MoonrakerConfigFilePath.strip()
+            self.MoonrakerServiceFileName = self.MoonrakerServiceFileName.strip()
+
+
+    def _ValidateGeneration3(self) -> None:
+        self._ValidatePathAndExists(self.RootFolder, "Required config var Root Folder was not found")
+        self._ValidatePathAndExists(self.ConfigFolder, "Required config var Config Folder was not found")
+        self._ValidatePathAndExists(self.LogsFolder, "Required config var Logs Folder was not found")
+        self._ValidatePathAndExists(self.LocalFileStorageFolder, "Required config var local storage folder was not found")
+        # This path wont exist on the first install, because it won't be created until the end of the install.
+        self._ValidateString(self.ServiceFilePath, "Required config var service file path was not found")
+        self._ValidateString(self.ServiceName, "Required config var service name was not found")
+
+
+    def _ValidateGeneration4(self) -> None:
+        # The printer ID can be None, this means it didn't exist before we installed the service.
+        pass
 
 
     def ParseCmdLineArgs(self):
@@ -3,18 +3,9 @@ import traceback
 
 from octoeverywhere.telemetry import Telemetry
 
-from .Linker import Linker
 from .Logging import Logger
-from .Service import Service
 from .Context import Context, OsTypes
-from .Discovery import Discovery
-from .DiscoveryCompanionAndBambu import DiscoveryCompanionAndBambu
-from .Configure import Configure
-from .Updater import Updater
 from .Permissions import Permissions
-from .TimeSync import TimeSync
-from .Frontend import Frontend
-from .Uninstall import Uninstall
 from .OptionalDepsInstaller import OptionalDepsInstaller
 
 class Installer:
@@ -25,21 +16,26 @@ class Installer:
             self._RunInternal()
         except Exception as e:
             tb = traceback.format_exc()
-            Logger.Blank()
-            Logger.Blank()
-            Logger.Error("Installer failed - "+str(e))
-            Logger.Blank()
-            Logger.Blank()
-            Logger.Error("Stack Trace:")
-            Logger.Error(str(tb))
-            Logger.Blank()
-            Logger.Blank()
-            Logger.Header("Please contact our support team directly at support@octoeverywhere.com so we can help you fix this issue!")
-            Logger.Blank()
-            Logger.Blank()
+            Logger.WriteBlock([
+                None,
+                None,
+                ("Error", "Installer failed - "+str(e)),
+                None,
+                None,
+                ("Error", "Stack Trace:"),
+                ("Error", str(tb)),
+                None,
+                None,
+                ("Header", "Please contact our support team directly at support@octoeverywhere.com so we can help you fix this issue!"),
+                None,
+                None,
+            ])
 
 
     def _RunInternal(self):
+        # Most of the installer modules are only needed by some of the run modes, so they are imported where they are used.
+        # This keeps things like -help, update, and uninstall from loading modules they never use, which is slow on some devices.
+        # pylint: disable=import-outside-toplevel
 
         #
         # Setup Phase
@@ -93,6 +89,7 @@ class Installer:
         # Ensure that the system clock sync is enabled. For some MKS PI systems the OS time is wrong and sync is disabled.
         # The user would of had to manually correct the time to get this installer running, but we will ensure that the
         # time sync systemd service is enabled to keep the clock in sync after reboots, otherwise it will cause SSL errors.
+        from .TimeSync import TimeSync
         TimeSync.EnsureNtpSyncEnabled(context)
 
         # Ensure the script at least has sudo permissions.
@@ -106,12 +103,14 @@ class Installer:
             permissions.EnsureFinalPermissions(context)
 
             # Do the update logic.
+            from .Updater import Updater
             update = Updater()
             update.DoUpdate(context)
             return
 
         # If we are running as an uninstaller, run that logic and exit.
         if context.IsUninstallMode:
+            from .Uninstall import Uninstall
             uninstall = Uninstall()
             uninstall.DoUninstall(context)
             return
@@ -123,9 +122,11 @@ class Installer:
         # If we are doing an companion or bambu setup, we need the user to help us input the details to the external moonraker IP or bambu printer.
         # This is the hardest part of the setup, because it's highly dependent on the system and different moonraker setups.
         if context.IsCompanionOrBambu():
+            from .DiscoveryCompanionAndBambu import DiscoveryCompanionAndBambu
             discovery = DiscoveryCompanionAndBambu()
             discovery.Discovery(context)
         else:
+            from .Discovery import Discovery
             discovery = Discovery()
             discovery.FindTargetMoonrakerFiles(context)
 
@@ -136,6 +137,7 @@ class Installer:
         context.Validate(2)
 
         # Next, based on the vars generated by discovery, complete the configuration of the context.
+        from .Configure import Configure
         configure = Configure()
         configure.Run(context)
 
@@ -143,11 +145,13 @@ class Installer:
         context.Validate(3)
 
         # For all types, do the frontend setup now.
+        from .Frontend import Frontend
         frontend = Frontend()
         frontend.DoFrontendSetup(context)
 
         # Before we start the service, check if the secrets config file already exists and if a printer id already exists.
         # This will indicate if this is a fresh install or not.
+        from .Linker import Linker
         context.ExistingPrinterId = Linker.GetPrinterIdFromServiceSecretsConfigFile(context)
 
         # Final validation
@@ -161,10 +165,12 @@ class Installer:
         OptionalDepsInstaller.WaitForInstallToComplete()
 
         # We are fully configured, create the service file and it's dependent files.
+        from .Service import Service
         service = Service()
         service.Install(context)
 
         # Add our auto update logic.
+        from .Updater import Updater
         updater = Updater()
         # If this is an companion or a Creality OS install, put the update script in the users root, so it's easy to find.
         if context.IsCompanionOrBambu() or context.IsCrealityOs():
@@ -177,15 +183,17 @@ class Installer:
         linker.Run(context)
 
         # Success!
-        Logger.Blank()
-        Logger.Blank()
-        Logger.Blank()
-        Logger.Purple("            ~~~ OctoEverywhere Setup Complete ~~~            ")
-        Logger.Warn(  "  You Can Access Your Printer Anytime From OctoEverywhere.com")
-        Logger.Header("                   Welcome To Our Community                  ")
-        Logger.Error( "                            <3                               ")
-        Logger.Blank()
-        Logger.Blank()
+        Logger.WriteBlock([
+            None,
+            None,
+            None,
+            ("Purple", "            ~~~ OctoEverywhere Setup Complete ~~~            "),
+            ("Warn",   "  You Can Access Your Printer Anytime From OctoEverywhere.com"),
+            ("Header", "                   Welcome To Our Community                  "),
+            ("Error",  "                            <3                               "),
+            None,
+            None,
+        ])
 
         # At the end on success, for OSs that don't have very much disk space, clean up the installer log file, since it's probably not needed.
         # If we need the log file for some reason, we should add a flag to the context to keep it.
@@ -197,53 +205,51 @@ class Installer:
         # We want to skip arguments until we find the json string and then concat all args after that together.
         # The reason is the PY args logic will split the entire command line string by space, so any spaces in the json get broken
         # up into different args. This only really happens in the case of the CMD_LINE_ARGS, since it can be like "-companion -debug -whatever"
-        jsonStr = None
-        for arg in sys.argv:
-            # Find the json start.
-            if len(arg) > 0 and arg[0] == '{':
-                jsonStr = arg
-            # Once we have started a json string, keep building it.
-            elif jsonStr is not None:
-                # We need to add the space back to make up for the space removed during the args split.
-                jsonStr += " " + arg
-        return jsonStr
+        # Find the json start.
+        start = next((i for i, arg in enumerate(sys.argv) if arg.startswith('{')), None)
+        if start is None:
+            return None
+        # Join everything from the json start on, adding the spaces back to make up for the ones removed during the args split.
+        return " ".join(sys.argv[start:])
 
 
     def PrintHelp(self):
-        Logger.Blank()
-        Logger.Blank()
-        Logger.Blank()
-        Logger.Blank()
-        Logger.Header("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-        Logger.Header("    OctoEverywhere For Klipper And Bambu Connect    ")
-        Logger.Header("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-        Logger.Blank()
-        Logger.Info("This installer can be used for:")
-        Logger.Info("   - OctoEverywhere for Klipper - Where Moonraker is running on this device.")
-        Logger.Info("   - OctoEverywhere for Creality - Where this device is a Creality device (Sonic Pad, K1, Ender v3, etc)")
-        Logger.Info("   - OctoEverywhere Companion - Where this plugin will connect to Moonraker running on a different device on the same LAN.")
-        Logger.Info("   - OctoEverywhere Bambu Connect - Where this plugin will connect to a Bambu Lab printer on the same LAN.")
-        Logger.Blank()
-        Logger.Warn("This installer is NOT for:")
-        Logger.Info("   - OctoPrint or OctoKlipper - If you're using OctoPrint, install OctoEverywhere directly in OctoPrint from the plugin manager.")
-        Logger.Blank()
-        Logger.Warn("Command line format:")
-        Logger.Info("  <moonraker config file path> <moonraker service file path> -other -args")
-        Logger.Blank()
-        Logger.Warn("Argument details:")
-        Logger.Info("  <moonraker config file path>  - optional - If supplied, the install will target this moonraker setup without asking or searching for others")
-        Logger.Info("  <moonraker service name> - optional - If supplied, the install will target this moonraker service file without searching.")
-        Logger.Info("       Used when multiple moonraker instances are ran on the same device. The service name is used to find the unique moonraker identifier. OctoEverywhere will follow the same naming convention. Typically the file name is something like `moonraker-1.service` or `moonraker-somename.service`")
-        Logger.Blank()
-        Logger.Warn("Other Optional Args:")
-        Logger.Info("  -help            - Shows this message.")
-        Logger.Info("  -update          - The installer will update all OctoEverywhere plugins on this device of any type.")
-        Logger.Info("  -companion       - Makes the setup target a OctoEverywhere Companion plugin setup.")
-        Logger.Info("  -bambu           - Makes the setup target a OctoEverywhere Bambu Connect plugin setup.")
-        Logger.Info("  -noatuoselect    - Disables auto selecting a moonraker instance, allowing the user to always choose.")
-        Logger.Info("  -debug           - Enable debug logging to the console.")
-        Logger.Info("  -skipsudoactions - Skips sudo required actions. This is useful for debugging, but will make the install not fully work.")
-        Logger.Blank()
-        Logger.Info("If you need help, contact our support team at support@octoeverywhere.com")
-        Logger.Blank()
-        Logger.Blank()
+        Logger.WriteBlock([
+            None,
+            None,
+            None,
+            None,
+            ("Header", "~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~"),
+            ("Header", "    OctoEverywhere For Klipper And Bambu Connect    "),
+            ("Header", "~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~"),
+            None,
+            ("Info", "This installer can be used for:"),
+            ("Info", "   - OctoEverywhere for Klipper - Where Moonraker is running on this device."),
+            ("Info", "   - OctoEverywhere for Creality - Where this device is a Creality device (Sonic Pad, K1, Ender v3, etc)"),
+            ("Info", "   - OctoEverywhere Companion - Where this plugin will connect to Moonraker running on a different device on the same LAN."),
+            ("Info", "   - OctoEverywhere Bambu Connect - Where this plugin will connect to a Bambu Lab printer on the same LAN."),
+            None,
+            ("Warn", "This installer is NOT for:"),
+            ("Info", "   - OctoPrint or OctoKlipper - If you're using OctoPrint, install OctoEverywhere directly in OctoPrint from the plugin manager."),
+            None,
+            ("Warn", "Command line format:"),
+            ("Info", "  <moonraker config file path> <moonraker service file path> -other -args"),
+            None,
+            ("Warn", "Argument details:"),
+            ("Info", "  <moonraker config file path>  - optional - If supplied, the install will target this moonraker setup without asking or searching for others"),
+            ("Info", "  <moonraker service name> - optional - If supplied, the install will target this moonraker service file without searching."),
+            ("Info", "       Used when multiple moonraker instances are ran on the same device. The service name is used to find the unique moonraker identifier. OctoEverywhere will follow the same naming convention. Typically the file name is something like `moonraker-1.service` or `moonraker-somename.service`"),
+            None,
+            ("Warn", "Other Optional Args:"),
+            ("Info", "  -help            - Shows this message."),
+            ("Info", "  -update          - The installer will update all OctoEverywhere plugins on this device of any type."),
+            ("Info", "  -companion       - Makes the setup target a OctoEverywhere Companion plugin setup."),
+            ("Info", "  -bambu           - Makes the setup target a OctoEverywhere Bambu Connect plugin setup."),
+            ("Info", "  -noatuoselect    - Disables auto selecting a moonraker instance, allowing the user to always choose."),
+            ("Info", "  -debug           - Enable debug logging to the console."),
+            ("Info", "  -skipsudoactions - Skips sudo required actions. This is useful for debugging, but will make the install not fully work."),
+            None,
+            ("Info", "If you need help, contact our support team at support@octoeverywhere.com"),
+            None,
+            None,
+        ])
@@ -1,4 +1,5 @@
 import os
+import sys
 import logging
 from datetime import datetime
 # pylint: disable=import-error # Only exists on linux
@@ -22,6 +23,15 @@ class Logger:
     OutputFilePath = None
     PyLogger = None
 
+    # Maps the WriteBlock styles to the console color and log file level, matching the single line functions below.
+    _BlockStyles = {
+        "Header": (BashColors.Cyan, "Info"),
+        "Info": (BashColors.Green, "Info"),
+        "Warn": (BashColors.Yellow, "Warn"),
+        "Error": (BashColors.Red, "Error"),
+        "Purple": (BashColors.Magenta, "Info"),
+    }
+
     @staticmethod
     def InitFile(userHomePath:str, userName:str):
         try:
@@ -115,6 +125,33 @@ class Logger:
         Logger._WriteToFile("Info", msg)
 
 
+    # Writes a block of lines to the console and log file in one go, rather than a write per line.
+    # Each line is a (style, msg) tuple, where the style is one of the keys in _BlockStyles, or None for a blank line.
+    @staticmethod
+    def WriteBlock(lines:list) -> None:
+        consoleLines = []
+        fileLines = []
+        now = str(datetime.now())
+        for line in lines:
+            # Like Blank(), blank lines are only printed to the console.
+            if line is None:
+                consoleLines.append("")
+                continue
+            style, msg = line
+            if style not in Logger._BlockStyles:
+                raise Exception(f"Unknown WriteBlock style: {style}")
+            color, level = Logger._BlockStyles[style]
+            consoleLines.append(color+msg+BashColors.Default)
+            fileLines.append(now + " ["+level+"] - " + msg+"\n")
+        consoleLines.append("")
+        sys.stdout.write("\n".join(consoleLines))
+        sys.stdout.flush()
+        try:
+            Logger.OutputFile.write("".join(fileLines))
+        except Exception:
+            pass
+
+
     @staticmethod
     def _WriteToFile(level:str, msg:str):
         try: